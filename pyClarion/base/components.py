@@ -25,6 +25,11 @@ from itertools import groupby
 Pt = TypeVar("Pt", bound="Process")
 
 
+# Shared output for processes emitting no data; NumDicts are immutable, so a
+# single instance can back every empty emission.
+_EMPTY_OUTPUT = nd.NumDict(default=0.0)
+
+
 class Process(object):
     """A basic component process."""
 
@@ -32,11 +37,13 @@ class Process(object):
 
     _client: Tuple[Symbol, ...]
     _expected: Tuple[SymbolicAddress, ...]
+    _expected_cache: Optional[Tuple[SymbolicAddress, ...]]
 
     def __init__(self, expected: Sequence[SymbolicAddress] = None):
 
         self._expected = tuple(expected or ())
         self._client = ()
+        self._expected_cache = None
 
     def __call__(self, inputs: Mapping[Any, nd.NumDict]) -> nd.NumDict:
         """
@@ -58,17 +65,26 @@ class Process(object):
     def expected(self) -> Tuple[SymbolicAddress, ...]:
         """Constructs from which self expects to receive activations."""
 
-        return tuple(expand_address(self.client, x) for x in self._expected)
+        # Address expansion is cached; the cache is invalidated on entrust().
+        expected = self._expected_cache
+        if expected is None:
+            client = self.client
+            expected = tuple(expand_address(client, x) for x in self._expected)
+            self._expected_cache = expected
+
+        return expected
 
     def entrust(self, path: Tuple[Symbol, ...]) -> None:
         """Entrust handling of construct to self."""
 
+        cls = type(self)
         parent, construct = path[:-1], path[-1]
-        if construct.ctype in type(self)._serves:
+        if construct.ctype in cls._serves:
             self._client = path
+            self._expected_cache = None
         else:
             msg = "{} cannot serve constructs of type {}."
-            name, ctype = type(self).__name__, repr(construct.ctype) 
+            name, ctype = cls.__name__, repr(construct.ctype)
             raise ValueError(msg.format(name, ctype))
 
     def check_inputs(self, inputs: Mapping[Any, nd.NumDict]) -> None:
@@ -83,8 +99,12 @@ class Process(object):
         self, inputs: Mapping[Any, nd.NumDict]
     ) -> Tuple[nd.NumDict, ...]:
 
-        self.check_inputs(inputs)
-        extracted = tuple(inputs[path] for path in self.expected)
+        # Performs the same check as check_inputs() in a single pass.
+        try:
+            extracted = tuple(inputs[path] for path in self.expected)
+        except KeyError as e:
+            msg = "Missing expected input from {}."
+            raise RuntimeError(msg.format(e.args[0])) from None
 
         return extracted
 
@@ -108,7 +128,7 @@ class Process(object):
         """
         
         if data is None:
-            return nd.NumDict(default=0.0)
+            return _EMPTY_OUTPUT
         elif data.default != 0:
             msg = "Unexpected default passed to {}."
             raise ValueError(msg.format(type(self).__name__))
@@ -132,6 +152,7 @@ class Composite(Process, Generic[Pt]):
         super().__init__(expected=_expected + base._expected)
 
         self._expected_top = _expected
+        self._expected_top_cache: Optional[Tuple[SymbolicAddress, ...]] = None
         self._base = base
 
     @property
@@ -163,12 +184,23 @@ class Composite(Process, Generic[Pt]):
     def expected_top(self) -> Tuple[SymbolicAddress, ...]:
         """Input constructs expected exclusively by the top of the composite."""
 
-        return tuple(expand_address(self.client, x) for x in self._expected_top)
+        # Cached like Process.expected; invalidated on entrust().
+        expected = self._expected_top_cache
+        if expected is None:
+            client = self.client
+            expected = tuple(
+                expand_address(client, x) for x in self._expected_top
+            )
+            self._expected_top_cache = expected
+
+        return expected
 
     def entrust(self, path: Tuple[Symbol, ...]) -> None:
         """Entrust handling of construct to self."""
 
         self.base.entrust(path)
+        self._expected_cache = None
+        self._expected_top_cache = None
 
 
 class Wrapped(Composite[Pt]):
@@ -235,20 +267,31 @@ class Domain(object):
         :param features: Features belongning to the domain.
         """
 
-        fset = set(features)
-        if len(fset) < len(features):
-            raise ValueError("Features may not contain duplicates.")
-        if len(dims(fset)) != len(list(k for k, g in groupby(dims(features)))):
-            raise ValueError("Features must be grouped by dimension.")
+        # Checks duplicates and dim grouping in a single pass, raising as soon
+        # as a violation is found.
+        seen: Set[feature] = set()
+        seen_dims: Set = set()
+        last_dim = None
+        for f in features:
+            if f in seen:
+                raise ValueError("Features may not contain duplicates.")
+            seen.add(f)
+            d = f.dim
+            if d != last_dim:
+                if d in seen_dims:
+                    raise ValueError("Features must be grouped by dimension.")
+                seen_dims.add(d)
+                last_dim = d
 
         self._features = features
 
     def __setattr__(self, name, value):
 
-        if name in type(self)._config and self._locked:
+        config = type(self)._config
+        if name in config and self._locked:
             raise RuntimeError("Cannot mutate locked domain.")
         super().__setattr__(name, value)
-        if not self._blocked and name in type(self)._config:
+        if not self._blocked and name in config:
             self.update()
 
     @property
@@ -281,6 +324,7 @@ class Interface(Domain):
     """A feature domain defining a control interface."""
 
     _cmds: Tuple[feature, ...]
+    _cmd_dims: FrozenSet
     _defaults: Tuple[feature, ...]
     _params: Tuple[feature, ...]
     _flags: Tuple[feature, ...]
@@ -303,17 +347,22 @@ class Interface(Domain):
 
         # TODO: Enforce fuzzy datatype for cmds when datatype markers are added.
 
-        if dims(set(cmds)) & dims(set(params)):
+        cmd_dims = dims(frozenset(cmds))
+        param_dims = dims(frozenset(params))
+        flag_dims = dims(frozenset(flags))
+        extra_dims = dims(frozenset(extras))
+
+        if cmd_dims & param_dims:
             raise ValueError("Cmds and params may not share dims.")
-        if dims(set(cmds)) & dims(set(flags)):
+        if cmd_dims & flag_dims:
             raise ValueError("Cmds and flags may not share dims.")
-        if dims(set(cmds)) & dims(set(extras)):
+        if cmd_dims & extra_dims:
             raise ValueError("Cmds and extras may not share dims.")
-        if dims(set(params)) & dims(set(flags)):
+        if param_dims & flag_dims:
             raise ValueError("Params and flags may not share dims.")
-        if dims(set(params)) & dims(set(extras)):
+        if param_dims & extra_dims:
             raise ValueError("Params and extras may not share dims.")
-        if dims(set(flags)) & dims(set(extras)):
+        if flag_dims & extra_dims:
             raise ValueError("Flags and extras may not share dims.")
 
         super().__init__(features=(cmds + params + flags + extras))
@@ -322,10 +371,15 @@ class Interface(Domain):
         self._params = params
         self._flags = flags
         self._extras = extras
+        self._cmd_dims = cmd_dims
 
         key = feature.dim.fget # type: ignore
         self._defaults = tuple(next(g) for k, g in groupby(self.cmds, key))
 
+        self._cmd_index = {f: i for i, f in enumerate(cmds)}
+        self._dim_index = {f.dim: i for i, f in enumerate(self._defaults)}
+        self._parse_cache: Dict[Tuple[feature, ...], Tuple[feature, ...]] = {}
+
     @property
     def cmds(self) -> Tuple[feature, ...]:
         """Interface commands."""
@@ -354,6 +408,11 @@ class Interface(Domain):
 
         return self._defaults
 
+    def cmd_index(self, cmd: feature) -> int:
+        """Return the position of cmd in self.cmds."""
+
+        return self._cmd_index[cmd]
+
     def parse_commands(self, data: nd.NumDict) -> Tuple[feature, ...]:
         """
         Determine the value associated with each control dimension.
@@ -364,19 +423,33 @@ class Interface(Domain):
         if data.default != 0.0:
             raise ValueError("Unexpected default strength.")
 
-        data = nd.squeeze(data)
-        data = nd.keep(data, keys=self.cmds)
-        if any(v != 1.0 for v in data.values()):
-            raise ValueError("Encountered non-integral cmd strength.")
-
-        cmds = tuple(f for f in self.cmds if f in data)
-        if len(cmds) > len(set(dims(self.cmds))):
-            raise ValueError("Encountered multiple values from a single dim.")
+        cmds = []
+        for f in self._cmds:
+            if f in data:
+                v = data[f]
+                if v == 0.0: # strengths at default are dropped, cf. squeeze()
+                    continue
+                if v != 1.0:
+                    raise ValueError("Encountered non-integral cmd strength.")
+                cmds.append(f)
+        key = tuple(cmds)
+
+        # Full parses are memoized; command combinations recur across cycles.
+        try:
+            return self._parse_cache[key]
+        except KeyError:
+            pass
 
         parse = list(self.defaults)
-        cmd_dims = dims(parse)
+        dim_index = self._dim_index
+        seen: Set[int] = set()
         for cmd in cmds:
-            i = cmd_dims.index(cmd.dim)
+            i = dim_index[cmd.dim]
+            if i in seen:
+                msg = "Encountered multiple values from a single dim."
+                raise ValueError(msg)
+            seen.add(i)
             parse[i] = cmd
+        result = self._parse_cache[key] = tuple(parse)
 
-        return tuple(parse)
\ No newline at end of file
+        return result
\ No newline at end of file
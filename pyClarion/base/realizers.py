@@ -8,7 +8,6 @@ from .symbols import ConstructType, Symbol, SymbolicAddress, feature
 from .components import Process, Assets
 from .. import numdicts as nd
 
-from itertools import combinations, chain
 from abc import abstractmethod
 from types import MappingProxyType
 from contextlib import nullcontext
@@ -38,10 +37,14 @@ class Realizer(Generic[Ot]):
     """
     Base class for construct realizers.
 
-    Provides a standard interface for creating, inspecting, and propagating 
-    information across construct networks.  
+    Provides a standard interface for creating, inspecting, and propagating
+    information across construct networks.
     """
 
+    __slots__ = (
+        "_parent", "_name", "_path", "_inputs", "_inputs_proxy", "_view_ref"
+    )
+
     _parent: Tuple[Symbol, ...]
     _inputs: Dict[Tuple[Symbol, ...], PullFunc]
 
@@ -60,8 +63,14 @@ class Realizer(Generic[Ot]):
         except LookupError:
             self._parent = ()
         self._name = name
+        # Parent and name never change after construction, so the symbolic
+        # path is computed once instead of rebuilt on every property access.
+        self._path = (*self._parent, name)
         self._inputs = {}
         self._inputs_proxy = MappingProxyType(self._inputs)
+        # Cached bound method, shared by all links to self. Avoids allocating
+        # a fresh bound-method object per link.
+        self._view_ref = self.view
         self._update_add_queue()
 
     def __repr__(self) -> Text:
@@ -84,7 +93,7 @@ class Realizer(Generic[Ot]):
     def path(self) -> Tuple[Symbol, ...]:
         """Symbolic path to self."""
 
-        return (*self._parent, self._name)
+        return self._path
 
     @property 
     def inputs(self) -> Mapping[Tuple[Symbol, ...], PullFunc]:
@@ -145,10 +154,12 @@ class Construct(Realizer[nd.NumDict], Generic[Pt]):
     A basic construct.
     
     Responsible for defining the behaviour of lowest-level constructs such as 
-    chunk or feature pools, bottom level networks, subsystem output terminals, 
+    chunk or feature pools, bottom level networks, subsystem output terminals,
     short term memory buffers and so on.
     """
 
+    __slots__ = ("_process", "_output")
+
     _process: Pt
 
     def __init__(self, name: Symbol, process: Pt) -> None:
@@ -177,7 +188,9 @@ class Construct(Realizer[nd.NumDict], Generic[Pt]):
 
     def step(self) -> None:
 
-        self.output = self.process(self._pull())
+        # _output is initialized at construction time, so it may be written
+        # directly, skipping the property machinery on the hot path.
+        self._output = self._process(self._pull())
 
     @property
     def output(self) -> nd.NumDict:
@@ -207,9 +220,21 @@ class Construct(Realizer[nd.NumDict], Generic[Pt]):
         logging.debug("Connecting %s to %s.", path, self.path)
         self._inputs[path] = callback
 
+    def _unlink(self, path: Tuple[Symbol, ...]) -> None:
+        """
+        Remove link from construct at path to self, if it exists.
+
+        :param path: Symbolic path for target construct.
+        """
+
+        logging.debug("Disconnecting %s from %s.", path, self.path)
+        self._inputs.pop(path, None)
+
     def _pull(self) -> Mapping[Tuple[Symbol, ...], nd.NumDict]:
 
-        return {src: ask() for src, ask in self.inputs.items()}
+        # Reads the underlying dict directly; the proxy view returned by the
+        # inputs property is for external consumers.
+        return {src: ask() for src, ask in self._inputs.items()}
 
         
 class Structure(Realizer[Mapping[Any, nd.NumDict]]):
@@ -229,22 +254,33 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
 
     # TODO: Deep nesting needs testing. - Can
 
+    __slots__ = (
+        "_dict", "_dict_proxy", "_watchers", "_sequence", "_leaf_keys",
+        "assets", "_build_ctx_token", "_build_list_token"
+    )
+
     _dict: Dict[Symbol, Realizer]
+    _sequence: Optional[Tuple[Construct, ...]]
+    _leaf_keys: Optional[Tuple[Tuple[Any, Construct], ...]]
+    _watchers: Dict[Tuple[Symbol, ...], List[Construct]]
     _assets: Any
 
     def __init__(self, name: Symbol, assets: Any = None) -> None:
         """
         Initialize a new Structure instance.
-        
+
         :param name: Identifier for client construct.
-        :param assets: Data structure storing persistent data shared among 
+        :param assets: Data structure storing persistent data shared among
             members of self.
         """
 
         super().__init__(name=name)
-        
+
         self._dict = {}
         self._dict_proxy = MappingProxyType(self._dict)
+        self._watchers = {}
+        self._sequence = None
+        self._leaf_keys = None
         self.assets = assets if assets is not None else Assets()
 
     def __contains__(self, key: SymbolicAddress) -> bool:
@@ -262,6 +298,12 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
 
     def __getitem__(self, key: SymbolicAddress) -> Any:
 
+        # Direct symbol keys are by far the most common; probe the member
+        # dict first and fall back to tuple-path resolution on a miss.
+        try:
+            return self._dict[key]
+        except KeyError:
+            pass
         if isinstance(key, tuple):
             if len(key) == 0:
                 raise KeyError("Key sequence must be of length 1 at least.")
@@ -270,9 +312,9 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
             else:
                 # Catch & output more informative error here? - Can
                 head = self[key[0]]
-                return head[key[1:]] 
+                return head[key[1:]]
         else:
-            return self._dict[key]
+            raise KeyError(key)
 
     def __enter__(self):
 
@@ -304,17 +346,23 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
     @property
     def output(self) -> Mapping[Any, nd.NumDict]:
 
-        key: SymbolicAddress
-        output, split = {}, len(self.path)
-        for r in self._leaves():
-            tail = r.path[split:]
-            if len(tail) == 1:
-                key, = tail
-            else:
-                key = tail
-            output[key] = r.output
+        # The recursive leaf traversal and path slicing are flattened into a
+        # cached tuple of (key, construct) pairs; the cache is invalidated by
+        # self._add().
+        leaf_keys = self._leaf_keys
+        if leaf_keys is None:
+            key: SymbolicAddress
+            pairs, split = [], len(self.path)
+            for r in self._leaves():
+                tail = r.path[split:]
+                if len(tail) == 1:
+                    key, = tail
+                else:
+                    key = tail
+                pairs.append((key, r))
+            leaf_keys = self._leaf_keys = tuple(pairs)
 
-        return output
+        return {key: r.output for key, r in leaf_keys}
 
     @output.deleter
     def output(self) -> None:
@@ -333,17 +381,24 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
         types will be stepped in the order that they were added to self.
         """
 
-        # The stepping order is correct b/c in Python 3.7 and above, dictionary 
-        # iteration returns values in insertion order. 
-        for realizer in self._dict.values():
-            realizer.step()
+        # The stepping order is correct b/c members are added to self in
+        # insertion order and leaves are traversed depth-first, which matches
+        # recursive member stepping. The flattened sequence is cached; the
+        # cache is invalidated by self._add().
+        sequence = self._sequence
+        if sequence is None:
+            sequence = self._sequence = tuple(self._leaves())
+        for construct in sequence:
+            construct.step()
 
     def _add(self, *realizers: Realizer) -> None:
         """Add realizers to self and any associated links."""
 
         for realizer in realizers:
             logging.debug("Adding %s to %s.", realizer.name, self.path)
-            self._dict[realizer.name] = realizer       
+            self._dict[realizer.name] = realizer
+        self._sequence = None
+        self._leaf_keys = None
 
     def _leaves(self) -> Iterator[Construct]:
         """Iterate over all Construct instances in self."""
@@ -359,15 +414,32 @@ class Structure(Realizer[Mapping[Any, nd.NumDict]]):
     def _weave(self) -> None:
         """Link all constructs in self."""
 
-        split = len(self.path)
+        base = self.path
+        split = len(base)
+        watchers = self._watchers
         for realizer in self._leaves():
-            for path in realizer.process.expected:
-                head, tail = path[:split], path[split:] 
-                if head != self.path:
+            expected = realizer.process.expected
+            if len(expected) == 0: # skip constructs with no inputs
+                continue
+            for path in expected:
+                head, tail = path[:split], path[split:]
+                if head != base:
                     raise ValueError("Unexpected path.")
                 try:
-                    view = self[tail].view
+                    view = self[tail]._view_ref
                 except KeyError as e:
                     raise RuntimeError("Missing construct") from e
                 else:
                     realizer._link(path, view)
+                    watchers.setdefault(path, []).append(realizer)
+
+    def _unweave(self) -> None:
+        """Remove all links created by a prior call to self._weave()."""
+
+        # The reverse index over watchers avoids scanning all member
+        # constructs and their inputs; only constructs known to be linked to
+        # each source are visited.
+        for path, watchers in self._watchers.items():
+            for realizer in watchers:
+                realizer._unlink(path)
+        self._watchers.clear()
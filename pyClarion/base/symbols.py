@@ -103,17 +103,21 @@ class Token(object):
     support mutation.
     """
 
-    __slots__ = ("_args")
+    __slots__ = ("_args", "_hash")
 
     _args: Tuple[Hashable, ...]
+    _hash: int
 
     def __init__(self, *args: Hashable):
 
+        # Tokens are immutable, so the hash is computed once up front; tokens
+        # serve as dict keys throughout and hash constantly.
         super().__setattr__("_args", tuple(args))
+        super().__setattr__("_hash", hash(self._args))
 
     def __hash__(self):
 
-        return hash(self._args)
+        return self._hash
 
     def __repr__(self):
 
@@ -236,29 +240,32 @@ class feature(Symbol):
         
         return "{}({})".format(cls_name, args)
 
+    # The accessors below read self._args directly rather than chaining
+    # through the cid property; these are hot in dim grouping and parsing.
+
     @property
     def dim(self):
         """Feature dimension, equal to (self.tag, self.lag)."""
 
-        return self.cid[0]
-    
+        return self._args[1][0]
+
     @property
     def val(self):
         """Feature value."""
-        
-        return self.cid[1]
+
+        return self._args[1][1]
 
     @property
     def tag(self):
         """Dimension tag."""
-        
-        return self.cid[0][0]
+
+        return self._args[1][0][0]
 
     @property
     def lag(self):
         """Lag value."""
-        
-        return self.cid[0][1]
+
+        return self._args[1][0][1]
 
 
 class chunk(Symbol):
@@ -35,7 +35,7 @@ class BLA(object):
 
     __slots__ = (
         "density", "baseline", "amplitude", "decay", "lags", "uses",
-        "lifetime"
+        "lifetime", "_value_cache"
     )
 
     def __init__(
@@ -67,6 +67,7 @@ class BLA(object):
         self.lags = deque([1], maxlen=depth)
         self.uses = 1
         self.lifetime = 1
+        self._value_cache: float = None
 
     def __repr__(self):
 
@@ -80,6 +81,12 @@ class BLA(object):
     def value(self):
         """The current BLA value."""
 
+        # The value only changes when the tracker steps, so it is computed
+        # lazily once per step; step() and reset() invalidate the cache.
+        cached = self._value_cache
+        if cached is not None:
+            return cached
+
         b = self.baseline
         c = self.amplitude
         lags = self.lags
@@ -96,6 +103,8 @@ class BLA(object):
             distant_approx = factor * t_term
             bla += c * distant_approx
 
+        self._value_cache = bla
+
         return bla
 
     @property
@@ -120,6 +129,7 @@ class BLA(object):
         for i in range(len(self.lags)):
             self.lags[i] += 1
         self.lifetime += 1
+        self._value_cache = None
 
     def reset(self):
         """Reset BLA tracker to initial state."""
@@ -128,6 +138,7 @@ class BLA(object):
         self.lags = deque([1], maxlen=maxlen)
         self.uses = 1
         self.lifetime = 1
+        self._value_cache = None
 
 
 class BLAs(Mapping):
@@ -27,6 +27,9 @@ class ParamSet(base.Process):
 
         self.store = nd.MutableNumDict(default=0.0)
         self.interface = interface
+        # Frozen set of param features; keeps membership tests in call() O(1)
+        # instead of scanning the interface param tuple per key.
+        self._param_keys = frozenset(interface.params)
 
     def call(self, inputs):
         """
@@ -39,23 +42,24 @@ class ParamSet(base.Process):
         """
 
         data, = self.extract_inputs(inputs)
-        cmd, = self.interface.parse_commands(data)
+        interface, store = self.interface, self.store
+        cmd, = interface.parse_commands(data)
 
-        cmd_index = self.interface.cmds.index(cmd) 
-        if cmd_index == 0: 
+        cmd_index = interface.cmd_index(cmd)
+        if cmd_index == 0:
             pass
-        elif cmd_index == 1: 
-            self.store.clear()
-        elif cmd_index == 2: 
-            param_strengths = nd.keep(data, keys=self.interface.params)
-            self.store.max(param_strengths)
-        else: 
+        elif cmd_index == 1:
+            store.clear()
+        elif cmd_index == 2:
+            param_strengths = nd.keep(data, keys=self._param_keys)
+            store.max(param_strengths)
+        else:
             assert cmd_index == 3
-            self.store.clear()
-            param_strengths = nd.keep(data, keys=self.interface.params)
-            self.store.max(param_strengths)
+            store.clear()
+            param_strengths = nd.keep(data, keys=self._param_keys)
+            store.max(param_strengths)
 
-        return self.store
+        return store
 
     class Interface(base.Interface):
         """Control interface for ParamSet instances."""
@@ -178,34 +182,59 @@ class Register(base.Process):
         cmd_data, src_data = datas[0], datas[1:]
 
         cmd, = self.interface.parse_commands(cmd_data)
-        cmd_index = self.interface.cmds.index(cmd) 
+
+        return self._update(cmd, src_data)
+
+    def _update(self, cmd, src_data, read=True):
+        """
+        Execute an already-parsed command and emit register output.
+
+        If read is False, skips output assembly and returns None; state and
+        flag maintenance still run.
+        """
+
+        interface, store, flags = self.interface, self.store, self.flags
+        blas = self.blas
+
+        cmd_index = interface.cmd_index(cmd)
         if cmd_index == 0:
             pass
         elif cmd_index == 1:
-            self.store.clear()
-        else: 
-            data = src_data[cmd_index - 2]
-            self.store.clearupdate(data)
-            if self.blas is not None:
-                for key in data: 
-                    self.blas.register_invocation(key, add_new=True)
-
-        if self.is_empty:
-            self.flags.extend(self.interface.flags, value=1.0)
+            store.clear()
         else:
-            self.flags.clear()
-
-        d = nd.MutableNumDict(self.store, default=0)
-        d.max(self.flags)
-        d.squeeze()
-
-        if self.blas is not None:
-            self.blas.step()
+            data = src_data[cmd_index - 2]
+            store.clearupdate(data)
+            if blas is not None:
+                for key in data:
+                    blas.register_invocation(key, add_new=True)
+
+        # Flags only change when the store transitions between empty and
+        # occupied; skip the rebuild/clear when already in the right state.
+        if len(store) == 0:
+            if len(flags) == 0:
+                flags.extend(interface.flags, value=1.0)
+        elif len(flags) > 0:
+            flags.clear()
+
+        d = None
+        if read:
+            if blas is None and len(flags) == 0:
+                # Common case: no flags to merge and no pending BLA deletions,
+                # so the store can be returned as is; consumers do not mutate
+                # it and emit() freezes a copy.
+                d = store
+            else:
+                # No squeeze here; emit() squeezes the final output anyway.
+                d = nd.MutableNumDict(store, default=0)
+                d.max(flags)
+
+        if blas is not None:
+            blas.step()
             # Remove items below threshold.
-            drop = [x for x in self.store if self.blas[x].below_threshold]
-            self.store.drop(keys=drop)
+            drop = [x for x in store if blas[x].below_threshold]
+            store.drop(keys=drop)
             for x in drop:
-                del self.blas[item]
+                del blas[x]
 
         return d
 
@@ -342,18 +371,29 @@ class RegisterArray(base.Process):
         """
 
         data = self.extract_inputs(inputs)
-        cmds = self.interface.parse_commands(data[0])
+        cmd_data, src_data = data[0], data[1:]
+        interface = self.interface
+        cmds = interface.parse_commands(cmd_data)
+        slots = interface.slots
+        cmd_index = interface.cmd_index
 
-        clr_cmd = self.interface.cmds.index(cmds[0])
+        clr_cmd = cmd_index(cmds[0])
         if clr_cmd == 1: # Global clear
             for cell in self.cells:
                 cell.store.clear()
 
+        # Commands are parsed once against the parent interface; cells receive
+        # their write commands directly, bypassing Register.call's parse path.
+        # The parse is ordered (clear, reads, writes), so the write command for
+        # cell i sits at index 1 + slots + i.
         d = nd.MutableNumDict(default=0.0)
         for i, cell in enumerate(self.cells):
-            cell_strengths = cell.call(inputs)
-            read_cmd = self.interface.cmds.index(cmds[i + 1])
-            if read_cmd == 2 * (i + 1) + 1: # Read cell
+            read_cmd = cmd_index(cmds[i + 1])
+            read = read_cmd == 2 * (i + 1) + 1
+            cell_strengths = cell._update(
+                cmds[1 + slots + i], src_data, read=read
+            )
+            if read: # Read cell
                 d.max(cell_strengths)
 
         return d
@@ -431,18 +471,15 @@ class RegisterArray(base.Process):
                 for i in range(self.slots)
             ]
 
-            cmds: Tuple[feature, ...] = clr_cmds
+            # Accumulate in lists to avoid quadratic tuple concatenation.
+            cmd_list: List[feature] = list(clr_cmds)
             for rcmds in read_cmds:
-                cmds += rcmds
-            for sub_interface in sub_interfaces:
-                cmds += sub_interface.cmds
-
-            flags: Tuple[feature, ...] = ()
-            for sub_interface in sub_interfaces:
-                flags += sub_interface.flags
-
+                cmd_list.extend(rcmds)
+            flag_list: List[feature] = []
             for sub_interface in sub_interfaces:
+                cmd_list.extend(sub_interface.cmds)
+                flag_list.extend(sub_interface.flags)
                 sub_interface.lock()
             self._sub_interfaces = tuple(sub_interfaces)
 
-            super().__init__(cmds=cmds, flags=flags)
+            super().__init__(cmds=tuple(cmd_list), flags=tuple(flag_list))
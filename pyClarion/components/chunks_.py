@@ -37,7 +37,7 @@ class Chunk(object):
     Specifies features and dimensional weights.
     """
 
-    __slots__ = ("_features", "_weights")
+    __slots__ = ("_features", "_weights", "_weight_sum", "_links")
 
     def __init__(
         self, 
@@ -49,13 +49,23 @@ class Chunk(object):
         if not (weights is None or dims.issuperset(weights)):
             raise ValueError("Weight dims do not match features.")
 
-        ws = nd.MutableNumDict(weights) 
+        ws = nd.MutableNumDict(weights)
         ws.extend(dims, value=1.0)
 
         assert set(ws) == dims
 
         self._features = frozenset(features)
-        self._weights = ws
+        self._weights = nd.freeze(ws)
+        # Denominator of bottom_up(); fixed once weights are frozen.
+        self._weight_sum = nd.val_sum(self._weights)
+        # (feature, dim, weight) triples with dims and weights resolved up
+        # front; the activation paths iterate these instead of re-deriving
+        # the dim and probing the weight dict per feature per call. Sorting
+        # replaces the hash-driven order of the feature set with a stable
+        # one that keeps same-dim features adjacent.
+        self._links = tuple(
+            (f, f.dim, self._weights[f.dim]) for f in sorted(self._features)
+        )
 
     def __repr__(self):
 
@@ -99,11 +109,11 @@ class Chunk(object):
         Implementation is based on p. 77-78 of Anatomy of the Mind.
         """
 
-        weighted = strength * self.weights
-
-        d = nd.MutableNumDict(default=0.0)
-        d.extend(self.features)
-        d.set_by(weighted, feature.dim.fget)
+        # Fused form of extend + set_by: each feature takes its dimensional
+        # strength directly, with weights pre-resolved per feature.
+        d = nd.MutableNumDict(
+            {f: strength * w for f, _, w in self._links}, default=0.0
+        )
 
         return d
 
@@ -119,12 +129,29 @@ class Chunk(object):
         no nonlinearity is included in the denominator of the equation.
         """
 
-        d = nd.keep(strengths, keys=self.features)
-        d = nd.max_by(d, keyfunc=feature.dim.fget) # get maxima by dims
-        weighted = d * self.weights 
-        strength = nd.val_sum(weighted) / nd.val_sum(self.weights)
-
-        return strength
+        # Fused form of keep + max_by + weighted sum: dimensional maxima are
+        # collected by probing strengths for this chunk's features only, and
+        # the weighted average is accumulated directly. Dimensions with no
+        # active feature contribute the default of strengths, as before.
+        default = strengths.default
+        maxima: Dict[Tuple[Hashable, int], float] = {}
+        get = maxima.get
+        for f, dm, _ in self._links:
+            if f in strengths:
+                v = strengths[f]
+                cur = get(dm)
+                maxima[dm] = v if cur is None else max(cur, v)
+
+        num = 0.0
+        for dm, w in self._weights.items():
+            m = get(dm)
+            if m is None:
+                if default is None:
+                    raise KeyError(dm)
+                m = default
+            num += m * w
+
+        return num / self._weight_sum
 
 
 Ct = TypeVar("Ct", bound="Chunk")
@@ -158,21 +185,29 @@ class Chunks(MutableMapping[chunk, Ct]):
             msg = "Must specify chunk type explicitly when data is passed."
             raise ValueError(msg)
 
-        _data: Dict[chunk, Ct]
-        if data is None:
-            _data = dict()
-        else:
-            _data = dict(data)
+        # Chunk forms are immutable, so the copy is a plain shallow dict.
+        _data: Dict[chunk, Ct] = dict(data) if data is not None else {}
         self._data: MutableMapping[chunk, Ct] = _data
 
         if chunk_type is None:
             self.Chunk = Chunk
         else:
             self.Chunk = chunk_type
-        
+
+        # Index from feature sets to member chunks bearing them; form lookups
+        # probe a single bucket instead of scanning the full database.
+        self._form_index: Dict[FrozenSet[feature], list] = {}
+        for ch, form in _data.items():
+            self._form_index.setdefault(form.features, []).append(ch)
+
         self._add_promises: MutableMapping[chunk, Ct] = dict()
+        self._add_promises_proxy = MappingProxyType(self._add_promises)
         self._del_promises: Set[chunk] = set()
 
+        # Bumped on every mutation; lets client processes cache derived
+        # structures against the database state.
+        self._version = 0
+
     def __repr__(self):
 
         repr_ = "{}({})".format(type(self).__name__, repr(self._data))
@@ -192,21 +227,35 @@ class Chunks(MutableMapping[chunk, Ct]):
 
     def __delitem__(self, key):
 
-        del self._data[key]
+        form = self._data.pop(key)
+        self._unindex_form(key, form)
+        self._version += 1
 
     def __setitem__(self, key, val):
 
         if isinstance(val, self.Chunk):
+            old = self._data.get(key)
+            if old is not None:
+                self._unindex_form(key, old)
             self._data[key] = val
+            self._form_index.setdefault(val.features, []).append(key)
+            self._version += 1
         else:
-            msg = "This chunk database expects chunks of type '{}'." 
-            TypeError(msg.format(type(self.Chunk.__name__)))
+            msg = "This chunk database expects chunks of type '{}'."
+            raise TypeError(msg.format(self.Chunk.__name__))
+
+    def _unindex_form(self, key, form):
+
+        bucket = self._form_index[form.features]
+        bucket.remove(key)
+        if len(bucket) == 0:
+            del self._form_index[form.features]
 
     @property
     def add_promises(self):
         """A view of promised additions."""
 
-        return MappingProxyType(self._add_promises)
+        return self._add_promises_proxy
 
     @property
     def del_promises(self):
@@ -233,14 +282,16 @@ class Chunks(MutableMapping[chunk, Ct]):
         Chunks.request_add()).
         """
 
-        # This may need a faster implementation in the future. - Can
+        # Candidate members share the probe's feature set by construction,
+        # since equal forms agree on features.
         chunks = set()
-        for ch, form_ch in self.items():
-            if form_ch == form:
-                chunks.add(ch)
-        for ch, form_ch in self._add_promises.items():
-            if form_ch == form:
+        for ch in self._form_index.get(form.features, ()):
+            if self._data[ch] == form:
                 chunks.add(ch)
+        if check_promises:
+            for ch, form_ch in self._add_promises.items():
+                if form_ch == form:
+                    chunks.add(ch)
 
         return chunks
 
@@ -252,9 +303,15 @@ class Chunks(MutableMapping[chunk, Ct]):
         Chunks.request_add()).
         """
 
-        found = self.find_form(form, check_promises)
-
-        return 0 < len(found) 
+        # Short-circuits on the first match instead of materializing the full
+        # match set as find_form() does.
+        data = self._data
+        candidates = self._form_index.get(form.features, ())
+        if any(data[ch] == form for ch in candidates):
+            return True
+        if check_promises:
+            return any(f == form for f in self._add_promises.values())
+        return False
 
     def request_add(self, ch, form):
         """
@@ -335,18 +392,53 @@ class TopDown(Process):
     def __init__(self, source: Symbol, chunks: Chunks):
 
         super().__init__(expected=(source,))
-        self.chunks = chunks 
+        self.chunks = chunks
+        self._items: tuple = ()
+        self._items_version: int = -1
+        # Staging buffer reused across calls; the emitted numdict copies its
+        # data on construction, so clearing per cycle is safe and avoids
+        # regrowing the hash table every call.
+        self._acc: Dict[feature, float] = {}
+
+    def _refresh_items(self) -> tuple:
+        """Return a chunk item snapshot synced to the database version."""
+
+        chunks = self.chunks
+        if chunks._version != self._items_version:
+            self._items = tuple(chunks.items())
+            self._items_version = chunks._version
+
+        return self._items
 
     def call(self, inputs):
         """Execute a top-down activation cycle."""
 
         strengths, = self.extract_inputs(inputs)
-        d = nd.MutableNumDict(default=0.0)
-        for ch, form in self.chunks.items():
-            d.max(form.top_down(strengths[ch]))
-        d.squeeze()
 
-        return d
+        # Nothing to propagate: all chunks sit at the zero default and every
+        # product would fail the positivity filter below.
+        if len(strengths) == 0 and strengths.default == 0.0:
+            return nd.NumDict(default=0.0)
+
+        # Grouped max-accumulation over all chunks in one pass; avoids the
+        # per-chunk numdicts of Chunk.top_down and the per-chunk max-merges.
+        # The empty accumulator's implicit baseline of 0 is restored by the
+        # final positivity filter, which also squeezes the output.
+        out = self._acc
+        out.clear()
+        get = out.get
+        for ch, form in self._refresh_items():
+            s = strengths[ch]
+            for f, _, w in form._links:
+                v = s * w
+                cur = get(f)
+                # Unconditional store through max() instead of a guarded
+                # write; the running maximum needs no branch on the update.
+                out[f] = v if cur is None else max(cur, v)
+
+        # The positivity-filter comprehension is a fresh float-valued dict,
+        # so the output can be built with the coercion-free constructor.
+        return nd.NumDict._new({k: v for k, v in out.items() if v > 0.0}, 0.0)
 
 
 class BottomUp(Process):
@@ -357,23 +449,93 @@ class BottomUp(Process):
     def __init__(self, source: Symbol, chunks: Chunks):
 
         super().__init__(expected=(source,))
-        self.chunks = chunks 
+        self.chunks = chunks
+        self._items: tuple = ()
+        self._feat_index: Dict[feature, tuple] = {}
+        self._items_version: int = -1
+        # Reusable staging buffer, as in TopDown; the emitted numdict copies
+        # its data on construction.
+        self._acc: Dict[chunk, float] = {}
+
+    def _refresh_items(self) -> tuple:
+        """Return a chunk item snapshot synced to the database version."""
+
+        chunks = self.chunks
+        if chunks._version != self._items_version:
+            self._items = tuple(chunks.items())
+            # Transpose of the chunk link sets, mapping each feature to the
+            # (chunk, dim) pairs it feeds; lets call() visit only chunks
+            # linked to active features when inputs are sparse.
+            feat_index: Dict[feature, list] = {}
+            for ch, form in self._items:
+                for f, dm, _ in form._links:
+                    feat_index.setdefault(f, []).append((ch, form, dm))
+            self._feat_index = {f: tuple(l) for f, l in feat_index.items()}
+            self._items_version = chunks._version
+
+        return self._items
 
-    def call(self, inputs): 
+    def call(self, inputs):
         """
         Execute a bottom-up activation cycle.
 
-        :param inputs: Dictionary mapping input constructs to their pull 
+        :param inputs: Dictionary mapping input constructs to their pull
             methods.
         """
 
         strengths, = self.extract_inputs(inputs)
-        d = nd.MutableNumDict(default=0.0)
-        for ch, form in self.chunks.items():
-            d[ch] = form.bottom_up(strengths)
-        d.squeeze()
 
-        return d
+        # Nothing to propagate: every feature sits at the zero default, so
+        # all chunks would bottom up to exactly 0.
+        if len(strengths) == 0 and strengths.default == 0.0:
+            return nd.NumDict(default=0.0)
+
+        items = self._refresh_items()
+
+        # Zero strengths sit at the output default and would be squeezed out
+        # anyway, so they are skipped as they are computed.
+        mapping = self._acc
+        mapping.clear()
+
+        if strengths.default == 0.0:
+            # Sparse path: chunks with no feature among the inputs bottom up
+            # to 0, so only chunks reached through the feature transpose are
+            # visited. Per-chunk dimension maxima are gathered first, then
+            # each touched chunk takes its weighted average with absent
+            # dimensions falling back to the zero default.
+            feat_index = self._feat_index
+            touched: Dict[chunk, Dict[Tuple[Hashable, int], float]] = {}
+            forms = {}
+            for f, v in strengths.items():
+                for ch, form, dm in feat_index.get(f, ()):
+                    dim_max = touched.get(ch)
+                    if dim_max is None:
+                        dim_max = touched[ch] = {}
+                        forms[ch] = form
+                    cur = dim_max.get(dm)
+                    dim_max[dm] = v if cur is None else max(cur, v)
+            for ch, dim_max in touched.items():
+                form = forms[ch]
+                get = dim_max.get
+                num = 0.0
+                for dm, w in form._weights.items():
+                    m = get(dm)
+                    if m is not None:
+                        num += m * w
+                s = num / form._weight_sum
+                if s != 0.0:
+                    mapping[ch] = s
+        else:
+            # Nonzero input defaults activate every linked feature; evaluate
+            # each chunk in full.
+            for ch, form in items:
+                s = form.bottom_up(strengths)
+                if s != 0.0:
+                    mapping[ch] = s
+
+        # The staging buffer is reused across calls, so the output takes a
+        # plain copy of it through the coercion-free constructor.
+        return nd.NumDict._new(dict(mapping), 0.0)
 
 
 class ChunkExtractor(Process):
@@ -17,7 +17,6 @@ from dataclasses import dataclass
 from typing import (
     NamedTuple, Tuple, Hashable, Union, Mapping, List, Iterable
 )
-from types import MappingProxyType
 import pprint
 
 
@@ -55,17 +54,20 @@ class Gated(Wrapped[Pt]):
         self.pidx = pidx
         self.interface = interface
         self.invert = invert
+        # The gating parameter feature is fixed by the interface config;
+        # resolve it once instead of on every postprocess call.
+        self._w_key = interface.params[pidx]
 
     def postprocess(self, inputs, output):
         """
         Gate output of base process.
 
-        Multiplies output of base process by gating parameter. If the invert 
+        Multiplies output of base process by gating parameter. If the invert
         option is selected, will first invert the gating parameter.
         """
 
         data, = self.extract_inputs(inputs)[:len(self.expected_top)]
-        w = data[self.interface.params[self.pidx]]
+        w = data[self._w_key]
         if self.invert:
             w = 1 - w
 
@@ -92,14 +94,17 @@ class Filtered(Wrapped[Pt]):
 
         super().__init__(base=base, expected=(controller,))
 
-        self.exempt = exempt or [] 
+        self.exempt = frozenset(exempt or ())
         self.invert = invert
 
     def preprocess(self, inputs):
 
         ws, = self.extract_inputs(inputs)[:len(self.expected_top)]
         if self.invert:
-            ws = 1 - ws
+            # Single-pass inversion; the arithmetic form 1 - ws would route
+            # through the generic binary-op machinery and a constant operand.
+            default = None if ws.default is None else 1.0 - ws.default
+            ws = nd.NumDict({k: 1.0 - v for k, v in ws.items()}, default)
 
         preprocessed = {}
         for source in self.base.expected:
@@ -108,7 +113,9 @@ class Filtered(Wrapped[Pt]):
             else:
                 preprocessed[source] = ws * inputs[source]
 
-        return MappingProxyType(preprocessed)
+        # The dict is freshly built and consumed only by the base process, so
+        # no read-only proxy is needed.
+        return preprocessed
 
 
 class Pruned(Wrapped[Pt]):
@@ -140,7 +147,7 @@ class Pruned(Wrapped[Pt]):
                 preprocessed[source] = nd.drop(
                     d=inputs[source], 
                     # TODO: Fix func: will break if address not tuple. - Can
-                    func=lambda address: address[-1].ctype in self.accept 
+                    func=lambda address: address[-1].ctype in self.accept
                 )
 
-        return MappingProxyType(preprocessed)
+        return preprocessed
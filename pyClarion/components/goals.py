@@ -60,7 +60,7 @@ class GoalStay(Process):
         self.interface = interface
         self.chunks = chunks
         self.blas = blas
-        self.update_blas = True
+        self.update_blas = update_blas
         self.prefix = prefix
         self._counter = count(1)
 
@@ -68,49 +68,55 @@ class GoalStay(Process):
         self.flags = nd.MutableNumDict(default=0)
         self.flags.extend((self.interface.flags[i] for i in (0, 3)), value=1.0)
 
+        # Flag combinations are fixed by the interface; precompute the frozen
+        # numdicts written on each command instead of rebuilding them per call.
+        fl = self.interface.flags
+        self._flag_sets = {
+            idxs: nd.NumDict({fl[i]: 1.0 for i in idxs})
+            for idxs in ((0, 3), (1, 3), (2, 3), (2, 4), (2, 5))
+        }
+
     def call(self, inputs) -> nd.NumDict:
         
         cmd_data, src_data = self.extract_inputs(inputs)
-        cmds = self.interface.parse_commands(cmd_data)
+        interface = self.interface
+        store, flag_store = self.store, self.flags
+        cmds = interface.parse_commands(cmd_data)
 
         cmd, = cmds
-        cmd_index = self.interface.cmds.index(cmd)
+        cmd_index = interface.cmd_index(cmd)
         if cmd_index == 0:
             pass
         elif cmd_index == 1:
             ch = chunk("{}_{}".format(self.prefix, next(self._counter)))
-            goal_fs = self.interface.parse_goal_params(cmd_data)
-            flags = (self.interface.flags[i] for i in (1, 3))
-            self.chunks[ch] = self.chunks.Chunk(features=goal_fs) 
+            goal_fs = interface.parse_goal_params(cmd_data)
+            self.chunks[ch] = self.chunks.Chunk(features=goal_fs)
             self.blas.register_invocation(ch, add_new=True)
-            self.store.clearupdate(nd.NumDict({ch: 1.0}))
-            self.flags.clearupdate(nd.NumDict({f: 1.0 for f in flags}))
+            store.clearupdate(nd.NumDict({ch: 1.0}))
+            flag_store.clearupdate(self._flag_sets[(1, 3)])
         elif cmd_index in [2, 3, 4]:
-            if len(self.store) == 0:
+            if len(store) == 0:
                 pass
             else:
-                old_goal, = self.store 
+                old_goal, = store
                 self.chunks.request_del(old_goal)
                 self.blas.request_del(old_goal)
                 if len(src_data) == 0:
-                    flags = (self.interface.flags[i] for i in (0, 3))
-                    self.store.clear()
-                    self.flags.clearupdate(nd.NumDict({f: 1.0 for f in flags}))
+                    store.clear()
+                    flag_store.clearupdate(self._flag_sets[(0, 3)])
                 else:
                     new_goal, = src_data
                     eidx = 1 + cmd_index
-                    flags = (self.interface.flags[i] for i in (2, eidx))
-                    self.store.clearupdate(src_data)
+                    store.clearupdate(src_data)
                     self.blas.register_invocation(new_goal)
-                    self.flags.clearupdate(nd.NumDict({f: 1.0 for f in flags}))
-        else: 
+                    flag_store.clearupdate(self._flag_sets[(2, eidx)])
+        else:
             assert cmd_index == 5
-            flags = (self.interface.flags[i] for i in (0, 3))
-            self.flags.clearupdate(nd.NumDict({f: 1.0 for f in flags}))
+            flag_store.clearupdate(self._flag_sets[(0, 3)])
 
         d = nd.MutableNumDict(default=0.0)
-        d.max(self.store)
-        d.max(self.flags)
+        d.max(store)
+        d.max(flag_store)
 
         if self.update_blas:
             self.blas.step()
@@ -206,10 +212,18 @@ class GoalStay(Process):
                 flags=tuple(feature(t, v) for t, vs in fspecs for v in vs),
                 extras=self.goals
             )
+
+            # Param-to-goal translation is deterministic; precompute it so
+            # parse_goal_params reduces to lookups.
+            self._param_to_goal = {
+                feature((self.name, g), v): feature(g, v) for g, v in gdvs
+            }
         
         def parse_goal_params(self, data):
 
-            params = tuple(f for f in self.params if f in data)
-            goals = tuple(feature(f.tag[1], f.val) for f in params)
+            param_to_goal = self._param_to_goal
+            goals = tuple(
+                param_to_goal[f] for f in self.params if f in data
+            )
 
             return goals
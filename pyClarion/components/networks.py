@@ -109,6 +109,9 @@ class SimpleQNet(Process):
 
         self._layers = tuple(layers)
 
+        # Frozenset for O(1) membership tests when filtering inputs.
+        self._input_keys = frozenset(domain.features)
+
         self._build_variables()
         self._build_network()
 
@@ -193,13 +196,12 @@ class SimpleQNet(Process):
     def call(self, inputs):
 
         x_strengths, r_strengths, a_strengths = self.extract_inputs(inputs)
-        input_features = self.domain.features
 
         tape = self._tape
         qs = self._qs
         loss = self.loss
 
-        _inputs = nd.keep(x_strengths, keys=input_features)
+        _inputs = nd.keep(x_strengths, keys=self._input_keys)
         self._inputs.clearupdate(_inputs)
 
         loss, qs = tape.evaluate(loss, qs)
@@ -216,7 +218,6 @@ class SimpleQNet(Process):
 
     def update(self, x_strengths, r_strengths, a_strengths) -> None:
         
-        input_features = self.domain.features
         r_mapping = self.r_domain.mapping
 
         tape = self._tape
@@ -245,6 +246,6 @@ class SimpleQNet(Process):
         
         self.loss = loss
 
-        _inputs_lag1 = nd.keep(x_strengths, keys=input_features)
+        _inputs_lag1 = nd.keep(x_strengths, keys=self._input_keys)
         self._inputs_lag1.clearupdate(_inputs_lag1)
         
\ No newline at end of file
@@ -18,6 +18,8 @@ from typing import (
 from typing import Iterable, Any
 from itertools import chain
 from copy import copy
+from math import exp, isclose
+import random
 
 
 ########################
@@ -30,14 +32,16 @@ class MaxNodes(Process):
 
     _serves = ConstructType.nodes
     _ctype_map = {
-        ConstructType.features: ConstructType.feature, 
+        ConstructType.features: ConstructType.feature,
         ConstructType.chunks: ConstructType.chunk
     }
 
+    # Class-level default; entrust() specializes this per instance.
+    accept = ConstructType.node
+
     def __init__(self, sources: Sequence[Symbol]):
 
         super().__init__(expected=sources)
-        self.accept = ConstructType.node
 
     def entrust(self, path):
 
@@ -47,11 +51,41 @@ class MaxNodes(Process):
     def call(self, inputs):
 
         data = self.extract_inputs(inputs)
-        d = nd.ew_max(*data)
-        d = nd.keep(d, func=lambda f: f.ctype in self.accept)
-        d = nd.squeeze(d)
 
-        return d
+        # Fused form of ew_max + keep + squeeze: one pass over the inputs,
+        # filtering by ctype and tracking maxima inline, instead of merging
+        # then filtering. Defaults only matter for keys missing from some
+        # input, so occurrence counts are tracked alongside the maxima.
+        accept = self.accept
+        n = len(data)
+        maxima: Dict[Symbol, float] = {}
+        counts: Dict[Symbol, int] = {}
+        get = maxima.get # bound once; saves an attribute lookup per entry
+        for strengths in data:
+            for k, v in strengths.items():
+                if k.ctype not in accept:
+                    continue
+                cur = get(k)
+                if cur is None:
+                    maxima[k] = v
+                    counts[k] = 1
+                else:
+                    if cur < v:
+                        maxima[k] = v
+                    counts[k] += 1
+
+        if any(strengths.default is None for strengths in data):
+            raise ValueError("Cannot squeeze numdict with no default.")
+        default = max(strengths.default for strengths in data)
+
+        mapping = {}
+        for k, v in maxima.items():
+            if counts[k] < n and v < default:
+                v = default
+            if not isclose(v, default):
+                mapping[k] = v
+
+        return nd.NumDict(mapping, default)
 
 
 ########################
@@ -73,9 +107,22 @@ class Repeater(Process):
     def call(self, inputs):
 
         d, = self.extract_inputs(inputs)
-        
+
         return d
 
+    def emit(self, data: nd.D = None) -> nd.NumDict:
+        """
+        Emit output.
+
+        Construct outputs are already frozen and squeezed, so repeated data
+        is passed through without copying.
+        """
+
+        if type(data) is nd.NumDict and data.default == 0:
+            return data
+
+        return super().emit(data)
+
 
 class Lag(Process):
     """Lags strengths for given set of features."""
@@ -92,18 +139,28 @@ class Lag(Process):
 
         super().__init__(expected=(source,))
         self.max_lag = max_lag
+        self._lag_map: Dict[feature, feature] = {}
 
     def call(self, inputs):
 
         d, = self.extract_inputs(inputs)
-        d = nd.transform_keys(d, func=lag, val=1)
-        d = nd.keep(d, func=self._filter)
 
-        return d
-
-    def _filter(self, f):
+        # The lag transform is deterministic per feature, so transformed keys
+        # are cached across cycles; only strengths are copied each call. The
+        # max-lag filter is applied in the same pass, dropping keys as they
+        # are transformed rather than in a second scan.
+        lag_map = self._lag_map
+        max_lag, ctype = self.max_lag, ConstructType.feature
+        mapped = {}
+        for f, v in d.items():
+            try:
+                lf = lag_map[f]
+            except KeyError:
+                lf = lag_map[f] = lag(f, val=1)
+            if lf.ctype in ctype and lf.lag <= max_lag:
+                mapped[lf] = v
 
-        return f.ctype in ConstructType.feature and f.lag <= self.max_lag
+        return nd.NumDict(mapped, d.default)
 
 
 ############################
@@ -149,6 +206,20 @@ class BoltzmannSelector(Process):
         self.temperature = temperature
         self.threshold = threshold
 
+    @property
+    def temperature(self):
+        """Temperature of the Boltzmann distribution."""
+
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, val):
+
+        self._temperature = val
+        # Partial evaluation: the reciprocal is fixed between assignments, so
+        # the per-candidate work in call() is a multiply, not a divide.
+        self._inv_temp = 1.0 / val
+
     def call(self, inputs):
         """
         Select chunks through an activation-based competition. 
@@ -158,12 +229,25 @@ class BoltzmannSelector(Process):
         """
 
         strengths, = self.extract_inputs(inputs)
-        thresholded = nd.threshold(strengths, th=self.threshold) 
-        probabilities = nd.boltzmann(thresholded, self.temperature)
-        d = nd.draw(probabilities, n=1)
-        d = nd.with_default(d, default=0)
-        
-        return d
+
+        # Fused form of threshold + boltzmann + draw: thresholding, the
+        # softmax and the weighted draw each traversed the candidate pool
+        # separately; here candidates are collected once and the draw runs
+        # directly on the unnormalized weights.
+        th, inv_t = self.threshold, self._inv_temp
+        items = [(k, v) for k, v in strengths.items() if th < v]
+        if len(items) == 0:
+            return nd.NumDict(default=0)
+        vmax = max(v for _, v in items)
+        weights = [exp((v - vmax) * inv_t) for _, v in items]
+        r = random.random() * sum(weights)
+        total = 0.0
+        for (k, _), w in zip(items, weights):
+            total += w
+            if r < total:
+                break
+
+        return nd.NumDict({k: 1.0}, default=0)
 
 
 class ActionSelector(Process):
@@ -196,6 +280,35 @@ class ActionSelector(Process):
         self.interface = interface
         self.temperature = temperature
 
+        # The dimension groupings are fixed by the interface config, so they
+        # are computed once here rather than per call: singleton param dims
+        # pass their strengths through, all other dims go through selection.
+        cmds_by_dims = group_by_dims(interface.cmds)
+        params_by_dims = group_by_dims(interface.params)
+        singles, groups = [], []
+        for dim, fs in chain(cmds_by_dims.items(), params_by_dims.items()):
+            if len(fs) == 1:
+                assert dim in params_by_dims
+                singles.append(fs[0])
+            else:
+                assert 1 < len(fs)
+                groups.append(tuple(fs))
+        self._singleton_params = tuple(singles)
+        self._select_groups = tuple(groups)
+
+    @property
+    def temperature(self):
+        """Temperature of the Boltzmann distributions."""
+
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, val):
+
+        self._temperature = val
+        # Partial evaluation, as in BoltzmannSelector.
+        self._inv_temp = 1.0 / val
+
     def call(self, inputs):
         """
         Select actionable chunks for execution. 
@@ -206,22 +319,24 @@ class ActionSelector(Process):
         """
 
         strengths, = self.extract_inputs(inputs)
-        cmds_by_dims = group_by_dims(self.interface.cmds)
-        params_by_dims = group_by_dims(self.interface.params)
-        items_by_dims = chain(cmds_by_dims.items(), params_by_dims.items())
 
+        inv_t = self._inv_temp
         d = nd.MutableNumDict(default=0)
-        for dim, fs in items_by_dims:
-            if len(fs) == 1: # output strength of singleton param dim
-                assert dim in params_by_dims
-                f, = fs
-                d[f] = strengths[f]
-            else: # select value for cmd dim or multivalue param dim
-                assert 1 < len(fs)
-                ipt = nd.NumDict({f: strengths[f] for f in fs})
-                prs = nd.boltzmann(ipt, self.temperature)
-                selection = nd.draw(prs, n=1)
-                d.update(selection)
+        for f in self._singleton_params: # output strength of singleton dim
+            d[f] = strengths[f]
+        for fs in self._select_groups: # select value for multivalue dim
+            # Fused per-dim boltzmann + draw, as in BoltzmannSelector;
+            # avoids building three numdicts for every dimension.
+            vals = [strengths[f] for f in fs]
+            vmax = max(vals)
+            weights = [exp((v - vmax) * inv_t) for v in vals]
+            r = random.random() * sum(weights)
+            total = 0.0
+            for f, w in zip(fs, weights):
+                total += w
+                if r < total:
+                    break
+            d[f] = 1.0
 
         return d
 
@@ -242,16 +357,41 @@ class Constants(Process):
     _serves = ConstructType.basic_construct
 
     def __init__(self, strengths = None) -> None:
-        
+
         self._check_default(strengths)
 
         super().__init__()
-        self.strengths = nd.squeeze(strengths) or nd.NumDict(default=0.0)
+        self.strengths = strengths
+
+    @property
+    def strengths(self) -> nd.NumDict:
+        """Stored constant strengths."""
+
+        return self._strengths
+
+    @strengths.setter
+    def strengths(self, data):
+
+        self._check_default(data)
+        self._strengths = nd.squeeze(data) or nd.NumDict(default=0.0)
 
     def call(self, inputs):
         """Return stored strengths."""
 
-        return self.strengths
+        return self._strengths
+
+    def emit(self, data: nd.D = None) -> nd.NumDict:
+        """
+        Emit output.
+
+        Stored strengths are squeezed once at assignment, so they are emitted
+        as is rather than re-squeezed every tick.
+        """
+
+        if data is self._strengths:
+            return data
+
+        return super().emit(data)
 
     @staticmethod
     def _check_default(strengths):
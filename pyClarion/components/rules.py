@@ -18,7 +18,7 @@ from types import MappingProxyType
 class Rule(object):
     """Represents a rule form."""
 
-    __slots__ = ("_conc", "_weights")
+    __slots__ = ("_conc", "_conds", "_weights", "_witems")
 
     def __init__(
         self, conc: chunk, *conds: chunk, weights: Dict[chunk, float] = None
@@ -40,12 +40,13 @@ class Rule(object):
             to condition weights.
         """
 
-        # preconditions
+        # preconditions; conds is typically tiny, so membership is checked by
+        # scanning the tuple rather than allocating a set
         if weights is not None:
-            if not set(conds).issuperset(weights): 
-                ValueError("Keys of arg `weights` do not match conds.")
+            if not all(c in conds for c in weights):
+                raise ValueError("Keys of arg `weights` do not match conds.")
             if not all(0 < v for v in weights.values()):
-                ValueError("Weights must be strictly positive.")
+                raise ValueError("Weights must be strictly positive.")
 
         ws = nd.MutableNumDict(weights)
         ws.extend(conds, value=1.0)
@@ -55,7 +56,12 @@ class Rule(object):
             ws /= w_sum
 
         self._conc = conc
+        self._conds = frozenset(ws)
         self._weights = nd.freeze(ws)
+        # Flat (cond, weight) layout frozen at construction; strength() and
+        # the rule-to-chunk channels read this instead of re-materializing
+        # weight items on every evaluation.
+        self._witems = tuple(self._weights.items())
 
         # postconditions
         assert set(self._weights) == set(conds), "Each cond must have a weight."
@@ -82,6 +88,12 @@ class Rule(object):
 
         return self._conc
 
+    @property
+    def conds(self) -> FrozenSet[chunk]:
+        """Conditions of rule."""
+
+        return self._conds
+
     @property
     def weights(self) -> nd.NumDict:
         """Conditions and condition weights of rule."""
@@ -98,9 +110,9 @@ class Rule(object):
         Implementation based on p. 60 and p. 73 of Anatomy of the Mind.
         """
 
-        weighted = nd.keep(strengths, keys=self.weights) * self.weights
-        
-        return nd.val_sum(weighted)
+        # Fused form of keep-multiply-sum over the condition weights; missing
+        # conditions fall back to the default of strengths, as before.
+        return sum(w * strengths[c] for c, w in self._witems)
 
 
 Rt = TypeVar("Rt", bound="Rule")
@@ -145,9 +157,20 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
         self.max_conds = max_conds
         self.Rule = rule_type if rule_type is not None else Rule
 
+        # Index from rule form keys to member rules bearing that form; lets
+        # contains_form() probe a single bucket instead of scanning self.
+        self._form_index: Dict[Tuple[chunk, FrozenSet[chunk]], list] = {}
+        for r, form in data.items():
+            self._form_index.setdefault(self._form_key(form), []).append(r)
+
         self._add_promises: MutableMapping[rule, Rt] = dict()
+        self._add_promises_proxy = MappingProxyType(self._add_promises)
         self._del_promises: Set[rule] = set()
 
+        # Bumped on every mutation; lets client processes cache derived
+        # structures against the database state.
+        self._version = 0
+
     def __repr__(self):
 
         repr_ = "{}({})".format(type(self).__name__, repr(self._data))
@@ -169,20 +192,27 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
 
         self._validate_rule_form(val)
         if isinstance(val, self.Rule):
+            old = self._data.get(key)
+            if old is not None:
+                self._unindex_form(key, old)
             self._data[key] = val
+            self._form_index.setdefault(self._form_key(val), []).append(key)
+            self._version += 1
         else:
-            msg = "This rule database expects rules of type '{}'." 
-            TypeError(msg.format(type(self.Rule.__name__)))
+            msg = "This rule database expects rules of type '{}'."
+            raise TypeError(msg.format(self.Rule.__name__))
 
     def __delitem__(self, key):
 
-        del self._data[key]
+        form = self._data.pop(key)
+        self._unindex_form(key, form)
+        self._version += 1
 
     @property
     def add_promises(self):
         """A view of promised additions."""
 
-        return MappingProxyType(self._add_promises)
+        return self._add_promises_proxy
 
     @property
     def del_promises(self):
@@ -214,7 +244,8 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
         See Rule for details on rule forms.
         """
 
-        return any(form == entry for entry in self.values())
+        candidates = self._form_index.get(self._form_key(form), ())
+        return any(form == self._data[r] for r in candidates)
 
     def request_add(self, r, form):
         """
@@ -264,6 +295,19 @@ class Rules(MutableMapping[rule, Rt], Generic[Rt]):
         self.update(self._add_promises)
         self._add_promises.clear()
 
+    @staticmethod
+    def _form_key(form) -> Tuple[chunk, FrozenSet[chunk]]:
+
+        return (form.conc, form.conds)
+
+    def _unindex_form(self, key, form):
+
+        form_key = self._form_key(form)
+        bucket = self._form_index[form_key]
+        bucket.remove(key)
+        if len(bucket) == 0:
+            del self._form_index[form_key]
+
     def _validate_rule_form(self, form):
 
         if self.max_conds is not None and len(form.weights) > self.max_conds:
@@ -309,6 +353,36 @@ class AssociativeRules(Process):
 
         super().__init__(expected=(source,))
         self.rules = rules
+        self._table: Tuple[Tuple[rule, chunk, tuple], ...] = ()
+        self._cond_index: Dict[chunk, Tuple[Tuple[rule, float], ...]] = {}
+        self._conc_map: Dict[rule, chunk] = {}
+        self._table_version: int = -1
+        # Staging buffers reused across calls; the emitted numdict copies
+        # its data on construction, so clearing these each cycle is safe
+        # and avoids reallocating pre-sized hash tables per call.
+        self._acc: Dict[Symbol, float] = {}
+        self._racc: Dict[rule, float] = {}
+
+    def _refresh_table(self) -> None:
+        """Sync cached rule structures to the database version."""
+
+        rules = self.rules
+        if rules._version == self._table_version:
+            return
+
+        # Flat (rule, conclusion, weight items) table plus a transpose
+        # indexing rules by condition; the latter lets call() iterate only
+        # the active conditions when inputs are sparse.
+        self._table = tuple(
+            (r, form.conc, form._witems) for r, form in rules.items()
+        )
+        cond_index: Dict[chunk, list] = {}
+        for r, _, witems in self._table:
+            for c, w in witems:
+                cond_index.setdefault(c, []).append((r, w))
+        self._cond_index = {c: tuple(l) for c, l in cond_index.items()}
+        self._conc_map = {r: conc for r, conc, _ in self._table}
+        self._table_version = rules._version
 
     def call(
         self, inputs: Mapping[Tuple[Symbol, ...], nd.NumDict]
@@ -316,16 +390,59 @@ class AssociativeRules(Process):
 
         strengths, = self.extract_inputs(inputs)
 
-        d = nd.MutableNumDict(default=0.0)
-        for r, form in self.rules.items():
-            s_r = form.strength(strengths)
-            d[form.conc] = max(d[form.conc], s_r)
-            d[r] = s_r
-        d.squeeze()
-
-        assert d.default == 0, "Unexpected output default."
-
-        return d
+        # Nothing to propagate: every condition sits at the zero default, so
+        # the table walk would only produce zeros for the squeeze to drop.
+        if len(strengths) == 0 and strengths.default == 0.0:
+            return nd.NumDict(default=0.0)
+
+        self._refresh_table()
+
+        # Accumulation runs on plain dicts with get accessors bound to
+        # locals; conclusion entries keep the zero baseline of the old
+        # mutable-numdict default, and exact zeros are squeezed on wrap-up.
+        out = self._acc
+        out.clear()
+        get = out.get
+
+        if strengths.default == 0.0:
+            # Sparse path: inactive conditions contribute nothing, so rule
+            # strengths are accumulated by iterating the active conditions
+            # through the transposed index. Untouched rules keep strength 0
+            # and would be squeezed out anyway.
+            cond_index = self._cond_index
+            racc = self._racc
+            racc.clear()
+            rget = racc.get
+            for c, s in strengths.items():
+                if s == 0.0:
+                    continue
+                for r, w in cond_index.get(c, ()):
+                    cur = rget(r)
+                    racc[r] = w * s if cur is None else cur + w * s
+            conc_map = self._conc_map
+            for r, s_r in racc.items():
+                conc = conc_map[r]
+                cur = get(conc)
+                if (0.0 if cur is None else cur) < s_r:
+                    out[conc] = s_r
+                out[r] = s_r
+        else:
+            # Nonzero input defaults feed every condition, active or not;
+            # fall back to evaluating the full table.
+            for r, conc, witems in self._table:
+                if len(witems) == 1:
+                    c, w = witems[0]
+                    s_r = w * strengths[c]
+                else:
+                    s_r = sum(w * strengths[c] for c, w in witems)
+                cur = get(conc)
+                if (0.0 if cur is None else cur) < s_r:
+                    out[conc] = s_r
+                out[r] = s_r
+
+        # The zero-filter comprehension is a fresh float-valued dict, so the
+        # output can be built with the coercion-free constructor.
+        return nd.NumDict._new({k: v for k, v in out.items() if v != 0.0}, 0.0)
 
 
 class ActionRules(Process):
@@ -351,6 +468,12 @@ class ActionRules(Process):
         super().__init__(expected=(source,))
         self.rules = rules
         self.temperature = temperature
+        self._table: Tuple[Tuple[rule, tuple], ...] = ()
+        self._conc_map: Dict[rule, chunk] = {}
+        self._table_version: int = -1
+        # Reusable staging buffer, as in AssociativeRules; the mutable
+        # numdict built from it copies the data.
+        self._acc: Dict[Symbol, float] = {}
 
     def call(
         self, inputs: Mapping[Tuple[Symbol, ...], nd.NumDict]
@@ -358,16 +481,35 @@ class ActionRules(Process):
 
         strengths, = self.extract_inputs(inputs)
 
-        d = nd.MutableNumDict(default=0)
-        for r, form in self.rules.items():
-            d[r] = form.strength(strengths)
+        # As in AssociativeRules, the database is accessed through flat
+        # caches keyed on its version: a (rule, weight items) table for
+        # strength computation and a rule-to-conclusion map for propagating
+        # the selected strength.
+        rules = self.rules
+        if rules._version != self._table_version:
+            self._table = tuple(
+                (r, form._witems) for r, form in rules.items()
+            )
+            self._conc_map = {r: form.conc for r, form in rules.items()}
+            self._table_version = rules._version
+
+        out = self._acc
+        out.clear()
+        for r, witems in self._table:
+            # Action rules have at most one condition by construction.
+            if len(witems) == 1:
+                c, w = witems[0]
+                out[r] = w * strengths[c]
+            else:
+                out[r] = sum(w * strengths[c] for c, w in witems)
+        d = nd.MutableNumDict(out, default=0)
 
         probabilities = nd.boltzmann(d, self.temperature)
         selection = nd.draw(probabilities, n=1)
 
         d *= selection
         d.squeeze()
-        d.max(nd.transform_keys(d, func=lambda r: self.rules[r].conc))
+        d.max(nd.transform_keys(d, func=self._conc_map.__getitem__))
 
         # postcondition
         assert d.default == 0, "Unexpected output default."
@@ -145,11 +145,14 @@ def threshold(
     keep default is True.
     """
 
-    mapping = {k: d[k] for k in d if th < d[k]}
+    # Iterating items avoids re-hashing each key for the comparison and the
+    # copy.
+    mapping = {k: v for k, v in d.items() if th < v}
+    default = None
     if d.default is not None:
-        default = d.default if keep_default or th < d.default else None 
+        default = d.default if keep_default or th < d.default else None
 
-    return NumDict(mapping, default)
+    return NumDict._new(mapping, default)
 
 
 def clip(d: D, low: float = None, high: float = None) -> NumDict:
@@ -175,13 +178,17 @@ def boltzmann(d: D, t: Union[float, int]) -> NumDict:
     is empty, the return value will also be empty.
     """
 
-    default = 0 if d.default is not None else None
+    default = 0.0 if d.default is not None else None
     if len(d) > 0:
-        x = d / t
-        x = x - val_max(x) # softmax(x) = softmax(x + c)
-        numerators = x.exp()
-        denominator = val_sum(numerators)
-        return with_default(numerators / denominator, default=default)
+        # Fused softmax with the max-subtraction trick: softmax(x) equals
+        # softmax(x + c), so shifting by the max prevents overflow in exp();
+        # a single pass replaces the chain of numdict ops.
+        vmax = max(d.values())
+        numerators = {k: math.exp((v - vmax) / t) for k, v in d.items()}
+        denominator = sum(numerators.values())
+        return NumDict._new(
+            {k: e / denominator for k, e in numerators.items()}, default
+        )
     else:
         return NumDict(default=default)
 
@@ -201,6 +208,18 @@ def draw(
     default value from d.
     """
 
+    if n == 1 and len(d) > 1:
+        # Single-draw fast path: one inverse-CDF scan over the unnormalized
+        # weights, skipping the per-round numdict copies of the general case.
+        items = tuple(d.items())
+        r = random.random() * sum(w for _, w in items)
+        total = 0.0
+        for k, w in items:
+            total += w
+            if r < total:
+                break
+        return NumDict({k: val}, d.default)
+
     pr = MutableNumDict(d)
     output = MutableNumDict()
     if len(d) > n:
@@ -333,7 +352,7 @@ def val_max(d: D) -> float:
 def val_min(d: D) -> float:
     """Return the minimum explicit value in d."""
 
-    return valuewise(max, d, float("+inf"))
+    return valuewise(min, d, float("+inf"))
 
 def all_val(d: D) -> bool:
     """Return True if all values, including the default, are truthy."""
@@ -15,7 +15,6 @@ from typing import (
     List, Union, Tuple, Set, Container, Iterator, overload, cast
 )
 from contextvars import ContextVar
-from dataclasses import dataclass, field
 from itertools import chain
 from functools import wraps
 import math
@@ -59,14 +58,23 @@ class GradientTapeError(Exception):
 
 
 # Needs to have a nice repr, awful to read w/ large numdicts.
-@dataclass
 class TapeCell(object):
     """A gradient tape entry."""
 
-    value: "NumDict"
-    op: str = ""
-    operands: Tuple[int, ...] = ()
-    kwds: dict = field(default_factory=dict) 
+    __slots__ = ("value", "op", "operands", "kwds")
+
+    def __init__(
+        self,
+        value: "NumDict",
+        op: str = "",
+        operands: Tuple[int, ...] = (),
+        kwds: dict = None
+    ) -> None:
+
+        self.value = value
+        self.op = op
+        self.operands = operands
+        self.kwds = kwds if kwds is not None else {}
 
 
 class GradientTape(object):
@@ -422,11 +430,32 @@ class NumDict(Mapping[Any, float]):
         """
 
         if data is None:
-            data = {}
-
-        self._dict = {k: float(data[k]) for k in data}
+            self._dict = {}
+        elif isinstance(data, NumDict):
+            # Values held by a NumDict are floats already; copy the backing
+            # dict directly instead of coercing per key.
+            self._dict = dict(data._dict)
+        else:
+            self._dict = {k: float(data[k]) for k in data}
         self._default = float(default) if default is not None else None
 
+    @classmethod
+    def _new(cls, data: Dict[Any, float], default: Optional[float]) -> "NumDict":
+        """
+        Construct an instance directly from a float-valued dict.
+
+        Specialized constructor for internal hot paths. Takes ownership of
+        data, which must already map keys to floats, and skips the per-key
+        coercion of __init__. Callers must not retain a mutable reference to
+        data and must pass a float or None default.
+        """
+
+        new = cls.__new__(cls)
+        new._dict = data
+        new._default = default
+
+        return new
+
     @property
     def default(self) -> Optional[float]:
         """Default value of NumDict instance."""
@@ -472,13 +501,15 @@ class NumDict(Mapping[Any, float]):
         to use d[key] to check for (explicit) membership.
         """
 
-        try:
-            return self._dict[key]
-        except KeyError:
-            if self._default is None:
-                raise
-            else:
-                return self._default
+        # Stored values are always floats, so None is a safe miss sentinel;
+        # this avoids try/except overhead on the hot path.
+        v = self._dict.get(key)
+        if v is not None:
+            return v
+        default = self._default
+        if default is None:
+            raise KeyError(key)
+        return default
 
     @register_op
     def __neg__(self) -> "NumDict":
@@ -727,6 +758,23 @@ class NumDict(Mapping[Any, float]):
 
         return (grads / d,)
 
+    @register_op
+    def sigmoid(self) -> "NumDict":
+        """Apply the logistic function elementwise to d."""
+
+        value = self._unary(self._sigmoid)
+        record_call(self.sigmoid, value, (self,), {})
+
+        return value
+
+    @staticmethod
+    @register_grad(sigmoid)
+    def _grad_sigmoid(grads: "NumDict", d: "NumDict") -> Tuple["NumDict", ...]:
+
+        s = d.sigmoid()
+
+        return (grads * s * (1 - s),)
+
     def _unary(self, op: Callable[[float], float]) -> "NumDict":
         """
         Apply op to each element of self.
@@ -768,8 +816,18 @@ class NumDict(Mapping[Any, float]):
         else:
             return NotImplemented
 
-        keys = set(self.keys()) | set(_other.keys())
-        mapping = {k: op(self[k], _other[k]) for k in keys}
+        # Two-loop merge over the backing dicts; avoids allocating the key
+        # union as a set. Values are floats, so None is a safe miss sentinel.
+        s_dict, o_dict = self._dict, _other._dict
+        mapping = {}
+        for k, v in s_dict.items():
+            ov = o_dict.get(k)
+            if ov is None:
+                ov = _other[k]
+            mapping[k] = op(v, ov)
+        for k, ov in o_dict.items():
+            if k not in s_dict:
+                mapping[k] = op(self[k], ov)
 
         default: Optional[float]    
         if self.default is None:
@@ -799,6 +857,11 @@ class NumDict(Mapping[Any, float]):
         except ValueError:
             return float("nan")
 
+    @staticmethod
+    def _sigmoid(x):
+
+        return 1.0 / (1.0 + math.exp(-x))
+
 
 class MutableNumDict(NumDict):
     """
@@ -874,8 +937,13 @@ class MutableNumDict(NumDict):
         Optionally, also update default.
         """
 
-        for k, v in numdict.items():
-            self.__setitem__(k, v)
+        if isinstance(numdict, NumDict):
+            # Values held by a NumDict are floats already; merge through the
+            # C-level dict.update instead of per-item __setitem__.
+            self._dict.update(numdict._dict)
+        else:
+            for k, v in numdict.items():
+                self.__setitem__(k, v)
         if update_default:
             self.default = numdict.default
 
@@ -1034,10 +1102,25 @@ class MutableNumDict(NumDict):
         else:
             return NotImplemented
 
-        keys = set(self.keys()) | set(_other.keys())
-        for k in keys:
-            self[k] = op(self[k], _other[k])
-        
+        # Iterate the two backing dicts directly instead of materializing the
+        # union of their key sets. Missing keys fall back on defaults, raising
+        # KeyError when the relevant default is undefined, as in __getitem__.
+        sd, od = self._dict, _other._dict
+        o_default = _other._default
+        for k, v in sd.items():
+            w = od.get(k)
+            if w is None:
+                if o_default is None:
+                    raise KeyError(k)
+                w = o_default
+            sd[k] = op(v, w)
+        s_default = self._default
+        for k, w in od.items():
+            if k not in sd:
+                if s_default is None:
+                    raise KeyError(k)
+                sd[k] = op(s_default, w)
+
         if self.default is None:
             default = None
         elif _other.default is None:
@@ -10,9 +10,7 @@ __all__ = ["log", "exp", "sigmoid", "tanh", "set_by", "sum_by", "max_by"]
 from .numdicts import (
     D, NumDict, MutableNumDict, record_call, register_op, register_grad
 )
-from .funcs import by
-
-from typing import TypeVar, Union, Callable, Hashable, Any
+from typing import TypeVar, Union, Callable, Hashable, Any, Dict
 import math
 
 
@@ -31,7 +29,7 @@ def exp(d: D) -> NumDict:
 def sigmoid(d: D) -> NumDict:
     """Apply the logistic function elementwise to d."""
 
-    return 1 / (1 + (-d).exp())
+    return d.sigmoid()
 
 
 def tanh(d: D) -> NumDict:
@@ -71,7 +69,14 @@ def sum_by(d: D, *, keyfunc: Callable[..., Hashable], **kwds: Any) -> NumDict:
     keyfunc(k) is equal to l. See by() for further details.
     """
 
-    value = by(d, sum, keyfunc, **kwds)
+    # Specialized form of by(): sums accumulate directly into the output
+    # mapping instead of materializing a list per group.
+    mapping: Dict[Hashable, float] = {}
+    for k, v in d.items():
+        g = keyfunc(k, **kwds)
+        cur = mapping.get(g)
+        mapping[g] = v if cur is None else cur + v
+    value = NumDict(mapping, d.default)
     _kwds = {"keyfunc": keyfunc}
     _kwds.update(kwds)
     record_call(sum_by, value, (d,), _kwds)
@@ -93,7 +98,15 @@ def max_by(d: D, *, keyfunc: Callable[..., Hashable], **kwds: Any) -> NumDict:
     keyfunc(k) is equal to l. See by() for further details.
     """
 
-    value = by(d, max, keyfunc, **kwds)
+    # Specialized form of by(): running maxima are kept directly in the
+    # output mapping instead of materializing a list per group.
+    mapping: Dict[Hashable, float] = {}
+    for k, v in d.items():
+        g = keyfunc(k, **kwds)
+        cur = mapping.get(g)
+        if cur is None or cur < v:
+            mapping[g] = v
+    value = NumDict(mapping, d.default)
     _kwds = {"keyfunc": keyfunc}
     _kwds.update(kwds)
     record_call(max_by, value, (d,), _kwds)
@@ -104,9 +117,14 @@ def max_by(d: D, *, keyfunc: Callable[..., Hashable], **kwds: Any) -> NumDict:
 @register_grad(max_by)
 def _grad_max_by(grads, d, *, keyfunc):
 
+    # Single pass: each key's group is resolved once, and the argmax test
+    # routes the incoming gradient directly, with no intermediate argmax set.
     _isclose = math.isclose
     y = max_by(d, keyfunc=keyfunc)
-    arg_max = {k for k, v in d.items() if _isclose(v, y[keyfunc(k)])}
-    grad_max = NumDict({k: grads[keyfunc(k)] if k in arg_max else 0 for k in d})
+    mapping = {}
+    for k, v in d.items():
+        g = keyfunc(k)
+        mapping[k] = grads[g] if _isclose(v, y[g]) else 0
+    grad_max = NumDict(mapping)
 
     return (grad_max,)